@@ -1,29 +1,61 @@
-import logging
+import asyncio
+import functools
 import os
-from collections import defaultdict
+import time
+
+try:
+    # C-accelerated drop-in for stdlib logging; asctime formatting in
+    # particular is much cheaper. Optional.
+    import picologging as logging
+except ImportError:  # pragma: no cover - optional speedup
+    import logging
+from collections import defaultdict, deque
 
 from telegram import (
     Update,
     InlineKeyboardMarkup,
     InlineKeyboardButton,
+    LinkPreviewOptions,
+    MessageOriginChannel,
+    MessageOriginChat,
+    MessageOriginHiddenUser,
+    MessageOriginUser,
 )
 from telegram.ext import (
     Application,
     CommandHandler,
     CallbackQueryHandler,
+    Defaults,
     MessageHandler,
     ContextTypes,
     filters,
 )
-from telegram.error import BadRequest, Forbidden
+from telegram.error import BadRequest, Forbidden, TelegramError
+from telegram.request import HTTPXRequest
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:  # pragma: no cover - optional speedup
+    AsyncLimiter = None
 
 # -------------------------------------------------
 # Logging
 # -------------------------------------------------
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    level=logging.INFO,
-)
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+logging.basicConfig(format=_LOG_FORMAT, level=logging.INFO)
+if logging.__name__ == "picologging":
+    # picologging has its own logger hierarchy; PTB and httpx still log
+    # through stdlib logging, so configure that root too or library
+    # logs silently vanish when the speedup is installed.
+    import logging as _stdlib_logging
+
+    _stdlib_logging.basicConfig(format=_LOG_FORMAT, level=_stdlib_logging.INFO)
 logger = logging.getLogger(__name__)
 
 BOT_NAME = "IDBlasterBot"
@@ -34,14 +66,198 @@ MADLABZ_SITE_URL = "https://madlabz.app"
 COMMAND_TG_URL = "https://t.me/LaunchCommand"   # TODO: replace
 COMMAND_BUY_URL = "https://pump.fun/coin/943mLkNDxGgTEb8hWkGLqhSAqiCs9fGcBCF8vkj8pump"         # TODO: replace
 
+class ORJSONRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Bot API responses with orjson.
+
+    The request side stays untouched — PTB form-encodes outgoing
+    parameters — but every incoming update/response payload goes through
+    the decoder, where orjson is a few times faster than stdlib json.
+    """
+
+    def parse_json_payload(self, payload: bytes):
+        try:
+            return orjson.loads(payload)
+        except ValueError as exc:
+            raise TelegramError("Invalid server response") from exc
+
+
+# Fall back to the stock request class when orjson is not installed, so
+# deployment isn't hard-gated on the optional dependency.
+_REQUEST_CLASS = HTTPXRequest if orjson is None else ORJSONRequest
+
+
 # -------------------------------------------------
-# In-memory state (no DB)
+# Pre-rendered response templates
 # -------------------------------------------------
-# Chats where ID commands are silenced (groups only)
-SILENT_CHATS: set[int] = set()
+# The bodies below are ~90% constant, so render them once and leave only
+# the dynamic fields as .format() placeholders. Rendering is deferred to
+# first use (functools.cache) so serverless/webhook cold starts don't
+# pay for string assembly at import time.
+@functools.cache
+def _templates() -> dict[str, str]:
+    help_text = "\n".join(
+        [
+            "👋 Hey {greeting}!",
+            "",
+            f"<b>{BOT_NAME}</b> helps you quickly view:",
+            "• Chat ID",
+            "• Topic ID",
+            "• User ID",
+            "",
+            "🔧 <b>Commands</b>",
+            "• <code>/id</code> – Full IDs + buttons",
+            "• <code>/chat</code> – Only chat ID",
+            "• <code>/topic</code> – Only topic ID",
+            "• <code>/replyid</code> – ID of the user you reply to",
+            "• <code>/about</code> – About MadLabz & $COMMAND",
+            "• <code>/mode</code> – Toggle silent mode (admins)",
+            "• <code>/clean</code> – Clean recent bot messages (admins)",
+            "• <code>/help</code> – Show this help message",
+            "",
+            "<b>Permissions</b>",
+            "• In groups, ID commands are <i>admin-only</i>.",
+            "• In private chat with the bot, everyone can use them.",
+            "",
+            f"⚙️ <i>{BRAND_TAGLINE}</i>",
+            f"🌐 {MADLABZ_SITE_URL}",
+        ]
+    )
+
+    about_text = (
+        "⚙️ <b>About IDBlasterBot</b>\n\n"
+        "<b>IDBlasterBot</b> is a tiny utility built for founders, mods, and devs who "
+        "need chat IDs, topic IDs, and user IDs <i>fast</i>.\n\n"
+        "It’s part of the <b>MadLabz</b> ecosystem — the lab behind tools like:\n"
+        "• SubutAI (AI warlord assistant)\n"
+        "\n"
+        "<b>$COMMAND</b> is the core token that powers the MadLabz empire.\n\n"
+        f"🌐 MadLabz Hub: <a href=\"{MADLABZ_SITE_URL}\">{MADLABZ_SITE_URL}</a>\n"
+        f"💬 Telegram: <a href=\"{COMMAND_TG_URL}\">{COMMAND_TG_URL}</a>\n"
+        f"💰 Buy $COMMAND: <a href=\"{COMMAND_BUY_URL}\">Trade link</a>\n\n"
+        f"⚙️ <i>{BRAND_TAGLINE}</i>"
+    )
+
+    footer = f"🔧 <i>{BRAND_TAGLINE}</i>\n🌐 {MADLABZ_SITE_URL}"
+
+    return {
+        "help": help_text,
+        "about": about_text,
+        "chat": (
+            "💬 <b>Chat ID</b>\n"
+            "Chat ID: <code>{chat_id}</code>\n"
+            "Chat Type: <code>{chat_type}</code>\n"
+            "Chat Title: {chat_title}\n\n" + footer
+        ),
+        "topic_with_id": (
+            "🧵 <b>Topic ID</b>\n"
+            "Topic ID (message_thread_id): <code>{thread_id}</code>\n\n" + footer
+        ),
+        "topic_none": (
+            "🧵 <b>Topic ID</b>\n"
+            "Topic ID: <i>None (not in a topic)</i>\n\n" + footer
+        ),
+        "replyid": (
+            "🎯 <b>Replied User</b>\n"
+            "User: {username}\n"
+            "User ID: <code>{user_id}</code>\n\n" + footer
+        ),
+    }
+
+
+_DENIED_ID_TEXT = (
+    "⛔ Only chat admins can use /id in groups.\n"
+    "Use it in a private chat with the bot if you’re not an admin."
+)
+_DENIED_CHAT_TEXT = "⛔ Only chat admins can use /chat in groups."
+_DENIED_TOPIC_TEXT = "⛔ Only chat admins can use /topic in groups."
+_DENIED_REPLYID_TEXT = "⛔ Only chat admins can use /replyid in groups."
+_DENIED_MODE_TEXT = "⛔ Only chat admins can change mode."
+_DENIED_CLEAN_TEXT = "⛔ Only chat admins can use /clean."
+
+_REPLYID_HINT_TEXT = (
+    "ℹ️ Reply to a user's message, then send /replyid to see their ID."
+)
+_MODE_PRIVATE_TEXT = "ℹ️ /mode is only for group chats."
+_MODE_USAGE_TEMPLATE = (
+    "⚙️ Current mode: <b>{current}</b>\n\n"
+    "Use:\n"
+    "• <code>/mode silent</code> – Bot stays quiet for ID commands in this chat\n"
+    "• <code>/mode group</code> – Bot replies normally again"
+)
+_MODE_SILENT_TEXT = (
+    "🤫 Silent mode <b>enabled</b> for this chat.\n"
+    "ID commands and forwarded messages will no longer get replies here.\n"
+    "Users can still DM the bot directly."
+)
+_MODE_GROUP_TEXT = (
+    "💬 Group mode <b>enabled</b> for this chat.\n"
+    "ID commands and forwards will reply here again."
+)
+_MODE_UNKNOWN_TEXT = (
+    "❓ Unknown mode.\nUse <code>/mode silent</code> or <code>/mode group</code>."
+)
+_CLEAN_EMPTY_TEXT = "ℹ️ No recent bot messages to clean in this chat."
 
-# Track bot messages per chat for /clean (store last ~50 ids)
-SENT_MESSAGES: dict[int, list[int]] = defaultdict(list)
+# -------------------------------------------------
+# In-memory state (no DB)
+# -------------------------------------------------
+# Chats where ID commands are silenced (groups only). Kept as an
+# immutable frozenset that /mode replaces wholesale (copy-on-write), so
+# concurrent readers under concurrent_updates always see a consistent
+# snapshot without locking.
+SILENT_CHATS: frozenset[int] = frozenset()
+
+# Track bot messages per chat for /clean (last 50 ids; deque drops the
+# oldest in O(1) instead of list.pop(0)'s memmove)
+SENT_MESSAGES: dict[int, deque[int]] = defaultdict(lambda: deque(maxlen=50))
+
+# Admin-status cache: (chat_id, user_id) -> (status, expires_at).
+# Saves a get_chat_member round-trip on every admin-gated command.
+_ADMIN_CACHE: dict[tuple[int, int], tuple[str, float]] = {}
+_ADMIN_TTL = 180.0
+_ADMIN_CACHE_MAX = 10_000
+_ADMIN_STATUSES = frozenset({"creator", "administrator"})
+
+# Debounce for rapid repeat ID commands:
+# (chat_id, user_id, command) -> (timestamp, text, keyboard).
+# A duplicate within the window re-sends the cached response without
+# redoing the admin check or rebuilding the payload.
+_LAST_CMD: dict[
+    tuple[int, int, str], tuple[float, str, InlineKeyboardMarkup | None]
+] = {}
+_DEBOUNCE = 0.5
+_LAST_CMD_MAX = 10_000
+
+# Pending "copy" button replies per (chat_id, thread_id), coalesced into
+# a single message after a short window so burst clicks don't double the
+# outbound sendMessage rate.
+_PENDING_COPIES: dict[tuple[int, int | None], list[str]] = {}
+_COPY_FLUSH_DELAY = 0.2
+
+# The event loop only keeps weak references to tasks, so fire-and-forget
+# tasks must be anchored here until done or they can be GC'd mid-flight.
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    """create_task with a strong reference; exceptions get logged
+    instead of dying as 'Task exception was never retrieved'."""
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_reap_task)
+    return task
+
+
+def _reap_task(task: asyncio.Task) -> None:
+    _BACKGROUND_TASKS.discard(task)
+    if not task.cancelled() and (exc := task.exception()) is not None:
+        logger.warning("Background task failed: %s", exc)
+
+# Per-chat token bucket (20 msgs/min, conservative) so we preempt
+# Telegram's per-chat flood limit instead of eating RetryAfter retries.
+# Lazily created; unused when aiolimiter isn't installed.
+_CHAT_LIMITERS: dict[int, "AsyncLimiter"] = {}
+_CHAT_LIMITERS_MAX = 10_000
 
 
 def is_silent_chat(chat) -> bool:
@@ -49,9 +265,29 @@ def is_silent_chat(chat) -> bool:
     return bool(chat and chat.type != "private" and chat.id in SILENT_CHATS)
 
 
+class NotSilentFilter(filters.MessageFilter):
+    """Drop messages from silenced groups inside PTB's routing.
+
+    Evaluated as a cheap predicate during dispatch, so silenced chats
+    never even get a handler task scheduled.
+    """
+
+    def filter(self, message) -> bool:
+        return not is_silent_chat(message.chat)
+
+
 # -------------------------------------------------
 # Helpers
 # -------------------------------------------------
+def _needs_admin_check(chat) -> bool:
+    """Only group chats gate commands on admin status.
+
+    Checking this before awaiting is_user_admin means DM traffic never
+    even allocates the coroutine.
+    """
+    return chat is not None and chat.type != "private"
+
+
 async def is_user_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
     """
     In groups/supergroups: only admins can use ID commands.
@@ -67,20 +303,63 @@ async def is_user_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> b
         # In DMs with the bot, always allow.
         return True
 
+    key = (chat.id, user.id)
+    now = time.monotonic()
+    cached = _ADMIN_CACHE.get(key)
+    if cached and cached[1] > now:
+        return cached[0] in _ADMIN_STATUSES
+
     try:
         member = await context.bot.get_chat_member(chat.id, user.id)
     except Exception as e:
         logger.warning("Failed to fetch chat member: %s", e)
         return False
 
-    return member.status in ("creator", "administrator")
+    if len(_ADMIN_CACHE) > _ADMIN_CACHE_MAX:
+        # Opportunistic eviction: drop everything that has expired,
+        # then fall back to FIFO (dicts are insertion-ordered) so the
+        # cache stays bounded even if nothing has expired yet.
+        for k in [k for k, v in _ADMIN_CACHE.items() if v[1] <= now]:
+            del _ADMIN_CACHE[k]
+        while len(_ADMIN_CACHE) > _ADMIN_CACHE_MAX:
+            del _ADMIN_CACHE[next(iter(_ADMIN_CACHE))]
+    _ADMIN_CACHE[key] = (member.status, now + _ADMIN_TTL)
 
+    return member.status in _ADMIN_STATUSES
 
-def build_id_payload(update: Update):
-    """
-    Build the ID info text and raw values for /id.
-    Returns (text, user_id, chat_id, topic_id_or_None).
-    """
+
+def _invalidate_admin_cache(chat_id: int) -> None:
+    """Drop cached admin statuses for one chat (used when /mode changes)."""
+    for k in [k for k in _ADMIN_CACHE if k[0] == chat_id]:
+        del _ADMIN_CACHE[k]
+
+
+def _debounced_response(chat, user, command: str):
+    """Return the cached (text, keyboard) if this exact command was just run."""
+    if not chat or not user:
+        return None
+    entry = _LAST_CMD.get((chat.id, user.id, command))
+    if entry and time.monotonic() - entry[0] < _DEBOUNCE:
+        return entry[1], entry[2]
+    return None
+
+
+def _remember_response(chat, user, command: str, text: str, keyboard=None):
+    if not chat or not user:
+        return
+    now = time.monotonic()
+    if len(_LAST_CMD) > _LAST_CMD_MAX:
+        # Same bounded-eviction scheme as _ADMIN_CACHE: drop expired
+        # entries first, then FIFO down to the cap.
+        for k in [k for k, v in _LAST_CMD.items() if now - v[0] >= _DEBOUNCE]:
+            del _LAST_CMD[k]
+        while len(_LAST_CMD) > _LAST_CMD_MAX:
+            del _LAST_CMD[next(iter(_LAST_CMD))]
+    _LAST_CMD[(chat.id, user.id, command)] = (now, text, keyboard)
+
+
+def _id_scalars(update: Update):
+    """Extract the hashable fields the /id response depends on."""
     msg = update.effective_message
     chat = update.effective_chat
     user = update.effective_user
@@ -89,70 +368,97 @@ def build_id_payload(update: Update):
     chat_id = chat.id if chat else "(no chat)"
     chat_type = chat.type if chat else "(unknown)"
     chat_title = chat.title if chat and chat.title else "(no title)"
+    user_id = user.id if user else None
+    if user:
+        username = f"@{user.username}" if user.username else "(no username)"
+    else:
+        username = None
 
-    lines = []
-    lines.append("🔎 <b>IDBlasterBot – ID Inspector</b>")
-    lines.append("")
-    lines.append("📌 <b>Chat Information</b>")
-    lines.append(f"Chat ID: <code>{chat_id}</code>")
-    lines.append(f"Chat Type: <code>{chat_type}</code>")
-    lines.append(f"Chat Title: {chat_title}")
+    return chat_id, chat_type, chat_title, user_id, username, thread_id
+
+
+# The /id response is deterministic in these six scalars, so repeat
+# invocations by the same admin in the same topic become a dict lookup.
+@functools.lru_cache(maxsize=1024)
+def _render_id_message(chat_id, chat_type, chat_title, user_id, username, thread_id):
     if thread_id is not None:
-        lines.append(f"Topic ID (message_thread_id): <code>{thread_id}</code>")
+        thread_line = f"Topic ID (message_thread_id): <code>{thread_id}</code>"
     else:
-        lines.append("Topic ID: <i>(not in a topic)</i>")
-    lines.append("")
+        thread_line = "Topic ID: <i>(not in a topic)</i>"
 
-    user_id = None
-    if user:
-        user_id = user.id
-        username = f"@{user.username}" if user.username else "(no username)"
-        lines.append("👤 <b>Your Information</b>")
-        lines.append(f"User: {username}")
-        lines.append(f"User ID: <code>{user_id}</code>")
-        lines.append("")
+    if user_id is not None:
+        user_block = (
+            "👤 <b>Your Information</b>\n"
+            f"User: {username}\n"
+            f"User ID: <code>{user_id}</code>"
+        )
     else:
-        lines.append("👤 <b>Your Information</b>")
-        lines.append("(no user info)")
-        lines.append("")
+        user_block = "👤 <b>Your Information</b>\n(no user info)"
 
-    lines.append(f"🔧 <i>{BRAND_TAGLINE}</i>")
-    # very light footer – Telegram auto-links this
-    lines.append(f"🌐 {MADLABZ_SITE_URL}")
+    # Single f-string instead of list-append + join — one allocation,
+    # and Telegram auto-links the site URL footer.
+    text = (
+        "🔎 <b>IDBlasterBot – ID Inspector</b>\n"
+        "\n"
+        "📌 <b>Chat Information</b>\n"
+        f"Chat ID: <code>{chat_id}</code>\n"
+        f"Chat Type: <code>{chat_type}</code>\n"
+        f"Chat Title: {chat_title}\n"
+        f"{thread_line}\n"
+        "\n"
+        f"{user_block}\n"
+        "\n"
+        f"🔧 <i>{BRAND_TAGLINE}</i>\n"
+        f"🌐 {MADLABZ_SITE_URL}"
+    )
+    return text, build_copy_buttons(user_id, chat_id, thread_id)
 
-    text = "\n".join(lines)
-    return text, user_id, chat_id, thread_id
 
+def build_id_message(update: Update):
+    """
+    Build the /id response in one pass.
+    Returns (text, reply_markup_or_None); both come out of the memoized
+    renderer, so a repeat hit is a scalar extraction plus a dict lookup.
+    """
+    return _render_id_message(*_id_scalars(update))
 
-def build_copy_buttons(user_id, chat_id, topic_id):
-    buttons = []
 
-    if user_id is not None:
-        buttons.append(
-            InlineKeyboardButton(
-                "👤 Copy User ID", callback_data=f"copy:user:{user_id}"
-            )
-        )
+_COPY_BUTTON_LABELS = {
+    "user": "👤 Copy User ID",
+    "chat": "💬 Copy Chat ID",
+    "topic": "🧵 Copy Topic ID",
+}
 
-    if chat_id is not None:
-        buttons.append(
-            InlineKeyboardButton(
-                "💬 Copy Chat ID", callback_data=f"copy:chat:{chat_id}"
-            )
-        )
 
-    if topic_id is not None:
-        buttons.append(
+# Markups are immutable in practice, so memoize them per (kind, id)
+# instead of rebuilding the PTB objects on every command.
+@functools.lru_cache(maxsize=4096)
+def _copy_markup(kind: str, value) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [[
             InlineKeyboardButton(
-                "🧵 Copy Topic ID", callback_data=f"copy:topic:{topic_id}"
+                _COPY_BUTTON_LABELS[kind], callback_data=f"copy:{kind}:{value}"
             )
-        )
+        ]]
+    )
 
-    if not buttons:
-        return None
 
-    keyboard = InlineKeyboardMarkup([buttons])
-    return keyboard
+@functools.lru_cache(maxsize=4096)
+def build_copy_buttons(user_id, chat_id, topic_id):
+    present = [
+        (kind, value)
+        for kind, value in zip(("user", "chat", "topic"), (user_id, chat_id, topic_id))
+        if value is not None
+    ]
+    if not present:
+        return None
+    if len(present) == 1:
+        return _copy_markup(*present[0])
+    buttons = [
+        InlineKeyboardButton(_COPY_BUTTON_LABELS[kind], callback_data=f"copy:{kind}:{value}")
+        for kind, value in present
+    ]
+    return InlineKeyboardMarkup([buttons])
 
 
 async def _reply_in_same_place(
@@ -168,34 +474,39 @@ async def _reply_in_same_place(
     """
     msg = update.effective_message
     chat = update.effective_chat
-    thread_id = msg.message_thread_id if msg else None
-
-    sent = None
+    if not msg or not chat:
+        return None
 
-    if chat and thread_id is not None:
+    # One call site, one shape: always go through bot.send_message with
+    # a kwargs dict instead of branching between send/reply paths.
+    kwargs = dict(
+        chat_id=chat.id,
+        text=text,
+        reply_markup=keyboard,
+    )
+    thread_id = msg.message_thread_id
+    if thread_id is not None:
         # Force-send into the same topic
-        sent = await context.bot.send_message(
-            chat_id=chat.id,
-            message_thread_id=thread_id,
-            text=text,
-            parse_mode="HTML",
-            reply_markup=keyboard,
-            disable_web_page_preview=True,
-        )
+        kwargs["message_thread_id"] = thread_id
     else:
         # Normal reply (private or non-topic chat)
-        sent = await msg.reply_text(
-            text,
-            parse_mode="HTML",
-            reply_markup=keyboard,
-            disable_web_page_preview=True,
-        )
+        kwargs["reply_to_message_id"] = msg.message_id
+
+    if AsyncLimiter is not None:
+        limiter = _CHAT_LIMITERS.get(chat.id)
+        if limiter is None:
+            # Buckets have no expiry, so FIFO-cap the dict; a chat that
+            # loses its bucket just starts a fresh (full) one.
+            while len(_CHAT_LIMITERS) >= _CHAT_LIMITERS_MAX:
+                del _CHAT_LIMITERS[next(iter(_CHAT_LIMITERS))]
+            limiter = _CHAT_LIMITERS[chat.id] = AsyncLimiter(20, 60)
+        async with limiter:
+            sent = await context.bot.send_message(**kwargs)
+    else:
+        sent = await context.bot.send_message(**kwargs)
 
     if sent:
-        msgs = SENT_MESSAGES[sent.chat_id]
-        msgs.append(sent.message_id)
-        if len(msgs) > 50:
-            msgs.pop(0)
+        SENT_MESSAGES[sent.chat_id].append(sent.message_id)
 
     return sent
 
@@ -206,151 +517,127 @@ async def _reply_in_same_place(
 async def start_or_help(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = update.effective_user
 
-    lines = [
-        f"👋 Hey {user.mention_html() if user else 'there'}!",
-        "",
-        f"<b>{BOT_NAME}</b> helps you quickly view:",
-        "• Chat ID",
-        "• Topic ID",
-        "• User ID",
-        "",
-        "🔧 <b>Commands</b>",
-        "• <code>/id</code> – Full IDs + buttons",
-        "• <code>/chat</code> – Only chat ID",
-        "• <code>/topic</code> – Only topic ID",
-        "• <code>/replyid</code> – ID of the user you reply to",
-        "• <code>/about</code> – About MadLabz & $COMMAND",
-        "• <code>/mode</code> – Toggle silent mode (admins)",
-        "• <code>/clean</code> – Clean recent bot messages (admins)",
-        "• <code>/help</code> – Show this help message",
-        "",
-        "<b>Permissions</b>",
-        "• In groups, ID commands are <i>admin-only</i>.",
-        "• In private chat with the bot, everyone can use them.",
-        "",
-        f"⚙️ <i>{BRAND_TAGLINE}</i>",
-        f"🌐 {MADLABZ_SITE_URL}",
-    ]
+    text = _templates()["help"].format(
+        greeting=user.mention_html() if user else "there"
+    )
 
-    await _reply_in_same_place(update, context, "\n".join(lines))
+    await _reply_in_same_place(update, context, text)
 
 
 async def about_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Brand story + shill zone for MadLabz / $COMMAND, but opt-in."""
-    text = (
-        "⚙️ <b>About IDBlasterBot</b>\n\n"
-        "<b>IDBlasterBot</b> is a tiny utility built for founders, mods, and devs who "
-        "need chat IDs, topic IDs, and user IDs <i>fast</i>.\n\n"
-        "It’s part of the <b>MadLabz</b> ecosystem — the lab behind tools like:\n"
-        "• SubutAI (AI warlord assistant)\n"
-        "\n"
-        "<b>$COMMAND</b> is the core token that powers the MadLabz empire.\n\n"
-        f"🌐 MadLabz Hub: <a href=\"{MADLABZ_SITE_URL}\">{MADLABZ_SITE_URL}</a>\n"
-        f"💬 Telegram: <a href=\"{COMMAND_TG_URL}\">{COMMAND_TG_URL}</a>\n"
-        f"💰 Buy $COMMAND: <a href=\"{COMMAND_BUY_URL}\">Trade link</a>\n\n"
-        f"⚙️ <i>{BRAND_TAGLINE}</i>"
-    )
-
-    await _reply_in_same_place(update, context, text)
+    await _reply_in_same_place(update, context, _templates()["about"])
 
 
 async def id_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Main ID inspector with copy buttons, no sticky."""
-    if not await is_user_admin(update, context):
-        await _reply_in_same_place(
-            update,
-            context,
-            "⛔ Only chat admins can use /id in groups.\n"
-            "Use it in a private chat with the bot if you’re not an admin.",
-        )
+    chat = update.effective_chat
+    user = update.effective_user
+
+    cached = _debounced_response(chat, user, "id")
+    if cached:
+        if not is_silent_chat(chat):
+            await _reply_in_same_place(update, context, cached[0], cached[1])
+        return
+
+    # Kick off the admin RPC and build the payload (cached render) while
+    # it is in flight.
+    admin_task = (
+        asyncio.create_task(is_user_admin(update, context))
+        if _needs_admin_check(chat)
+        else None
+    )
+    text, keyboard = build_id_message(update)
+
+    if admin_task is not None and not await admin_task:
+        await _reply_in_same_place(update, context, _DENIED_ID_TEXT)
         return
 
-    chat = update.effective_chat
     if is_silent_chat(chat):
         return
 
-    text, user_id, chat_id, topic_id = build_id_payload(update)
-    keyboard = build_copy_buttons(user_id, chat_id, topic_id)
+    _remember_response(chat, user, "id", text, keyboard)
 
     await _reply_in_same_place(update, context, text, keyboard)
 
 
 async def chat_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show only chat ID (admin-only in groups)."""
-    if not await is_user_admin(update, context):
-        await _reply_in_same_place(
-            update,
-            context,
-            "⛔ Only chat admins can use /chat in groups.",
-        )
-        return
-
     chat = update.effective_chat
-    if not chat:
+    user = update.effective_user
+
+    cached = _debounced_response(chat, user, "chat")
+    if cached:
+        if not is_silent_chat(chat):
+            await _reply_in_same_place(update, context, cached[0], cached[1])
         return
 
-    if is_silent_chat(chat):
+    if not chat:
         return
 
+    admin_task = (
+        asyncio.create_task(is_user_admin(update, context))
+        if _needs_admin_check(chat)
+        else None
+    )
     chat_id = chat.id
-    chat_type = chat.type
-    chat_title = chat.title if chat.title else "(no title)"
-
-    text = (
-        "💬 <b>Chat ID</b>\n"
-        f"Chat ID: <code>{chat_id}</code>\n"
-        f"Chat Type: <code>{chat_type}</code>\n"
-        f"Chat Title: {chat_title}\n\n"
-        f"🔧 <i>{BRAND_TAGLINE}</i>\n"
-        f"🌐 {MADLABZ_SITE_URL}"
+    text = _templates()["chat"].format(
+        chat_id=chat_id,
+        chat_type=chat.type,
+        chat_title=chat.title if chat.title else "(no title)",
     )
+    keyboard = _copy_markup("chat", chat_id)
 
-    keyboard = InlineKeyboardMarkup(
-        [[InlineKeyboardButton("💬 Copy Chat ID", callback_data=f"copy:chat:{chat_id}")]]
-    )
+    if admin_task is not None and not await admin_task:
+        await _reply_in_same_place(update, context, _DENIED_CHAT_TEXT)
+        return
+
+    if is_silent_chat(chat):
+        return
+    _remember_response(chat, user, "chat", text, keyboard)
 
     await _reply_in_same_place(update, context, text, keyboard)
 
 
 async def topic_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show only topic ID (admin-only in groups)."""
-    if not await is_user_admin(update, context):
-        await _reply_in_same_place(
-            update,
-            context,
-            "⛔ Only chat admins can use /topic in groups.",
-        )
-        return
-
     chat = update.effective_chat
-    if is_silent_chat(chat):
+    user = update.effective_user
+
+    cached = _debounced_response(chat, user, "topic")
+    if cached:
+        if not is_silent_chat(chat):
+            await _reply_in_same_place(update, context, cached[0], cached[1])
         return
 
     msg = update.effective_message
     if not msg:
         return
 
+    admin_task = (
+        asyncio.create_task(is_user_admin(update, context))
+        if _needs_admin_check(chat)
+        else None
+    )
     thread_id = msg.message_thread_id
-    if thread_id is None:
-        text = (
-            "🧵 <b>Topic ID</b>\n"
-            "Topic ID: <i>None (not in a topic)</i>\n\n"
-            f"🔧 <i>{BRAND_TAGLINE}</i>\n"
-            f"🌐 {MADLABZ_SITE_URL}"
-        )
-        await _reply_in_same_place(update, context, text)
+    if thread_id is not None:
+        text = _templates()["topic_with_id"].format(thread_id=thread_id)
+        keyboard = _copy_markup("topic", thread_id)
+    else:
+        text = _templates()["topic_none"]
+        keyboard = None
+
+    if admin_task is not None and not await admin_task:
+        await _reply_in_same_place(update, context, _DENIED_TOPIC_TEXT)
         return
 
-    text = (
-        "🧵 <b>Topic ID</b>\n"
-        f"Topic ID (message_thread_id): <code>{thread_id}</code>\n\n"
-        f"🔧 <i>{BRAND_TAGLINE}</i>\n"
-        f"🌐 {MADLABZ_SITE_URL}"
-    )
+    if is_silent_chat(chat):
+        return
 
-    keyboard = InlineKeyboardMarkup(
-        [[InlineKeyboardButton("🧵 Copy Topic ID", callback_data=f"copy:topic:{thread_id}")]]
-    )
+    if thread_id is None:
+        await _reply_in_same_place(update, context, text)
+        return
+    _remember_response(chat, user, "topic", text, keyboard)
 
     await _reply_in_same_place(update, context, text, keyboard)
 
@@ -359,85 +646,126 @@ async def replyid_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Show ID of the user you replied to (admin-only in groups).
     """
-    if not await is_user_admin(update, context):
-        await _reply_in_same_place(
-            update,
-            context,
-            "⛔ Only chat admins can use /replyid in groups.",
-        )
+    chat = update.effective_chat
+    msg = update.effective_message
+    if not msg:
+        return
+
+    admin_task = (
+        asyncio.create_task(is_user_admin(update, context))
+        if _needs_admin_check(chat)
+        else None
+    )
+
+    target = (
+        msg.reply_to_message.from_user
+        if msg.reply_to_message and msg.reply_to_message.from_user
+        else None
+    )
+    if target:
+        username = f"@{target.username}" if target.username else "(no username)"
+        text = _templates()["replyid"].format(username=username, user_id=target.id)
+
+    if admin_task is not None and not await admin_task:
+        await _reply_in_same_place(update, context, _DENIED_REPLYID_TEXT)
         return
 
-    chat = update.effective_chat
     if is_silent_chat(chat):
         return
 
-    msg = update.effective_message
-    if not msg:
+    if not target:
+        await _reply_in_same_place(update, context, _REPLYID_HINT_TEXT)
         return
 
-    if not msg.reply_to_message or not msg.reply_to_message.from_user:
-        await _reply_in_same_place(
-            update,
-            context,
-            "ℹ️ Reply to a user's message, then send /replyid to see their ID.",
-        )
+    await _reply_in_same_place(update, context, text, _copy_markup("user", target.id))
+
+
+# Full reply line per id type, prevalidated: an id type outside this
+# table (impossible for our own buttons) is simply ignored.
+_COPY_REPLY_TEMPLATES = {
+    "user": "User ID: <code>{value}</code>",
+    "chat": "Chat ID: <code>{value}</code>",
+    "topic": "Topic ID: <code>{value}</code>",
+}
+
+
+async def _flush_copies(bot, key: tuple[int, int | None]):
+    """Send all copy replies queued for a chat/topic as one message."""
+    pending = _PENDING_COPIES.pop(key, None)
+    if not pending:
         return
 
-    target = msg.reply_to_message.from_user
-    username = f"@{target.username}" if target.username else "(no username)"
+    chat_id, thread_id = key
+    text = "\n".join(pending)
 
-    text = (
-        "🎯 <b>Replied User</b>\n"
-        f"User: {username}\n"
-        f"User ID: <code>{target.id}</code>\n\n"
-        f"🔧 <i>{BRAND_TAGLINE}</i>\n"
-        f"🌐 {MADLABZ_SITE_URL}"
-    )
+    try:
+        sent = await bot.send_message(
+            chat_id=chat_id,
+            message_thread_id=thread_id,
+            text=text,
+        )
+    except Exception as e:
+        logger.warning("Failed to send copy reply: %s", e)
+        return
 
-    keyboard = InlineKeyboardMarkup(
-        [[InlineKeyboardButton("👤 Copy User ID", callback_data=f"copy:user:{target.id}")]]
-    )
+    if sent:
+        SENT_MESSAGES[sent.chat_id].append(sent.message_id)
 
-    await _reply_in_same_place(update, context, text, keyboard)
+
+def _is_copy_callback(data) -> bool:
+    """Callable pattern for CallbackQueryHandler: a C-level startswith
+    beats running the regex engine on every callback update."""
+    return isinstance(data, str) and data.startswith("copy:")
 
 
 async def copy_id_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Handle inline 'Copy ID' buttons.
+    Telegram requires the answer() per query; the visible reply is
+    coalesced per chat so button-mashing produces one message.
+    The two API calls never serialize: answer() runs as its own task
+    while the reply goes out via the coalescing flush, so total latency
+    is max(rtt_answer, rtt_reply) rather than their sum.
+
+    Deliberately no is_user_admin() check here: the buttons only exist
+    on messages that already passed the admin gate, and they echo ids
+    that were visible in that message anyway. Re-verifying would add a
+    get_chat_member round-trip per press for zero security gain — don't
+    reintroduce it.
     """
     query = update.callback_query
-    await query.answer()
+    # answerCallbackQuery's result is unused — fire it as a task so it
+    # overlaps the reply path instead of serializing in front of it.
+    _spawn(query.answer())
 
+    # The handler's pattern already guarantees the "copy:" prefix, and
+    # partition never raises — it just yields empty fields.
     data = query.data or ""
-    if not data.startswith("copy:"):
+    _, _, rest = data.partition(":")      # 'user:123'
+    id_type, _, value = rest.partition(":")
+    if not value:
         return
 
-    try:
-        _, id_type, value = data.split(":", 2)
-    except ValueError:
+    template = _COPY_REPLY_TEMPLATES.get(id_type)
+    if template is None or not query.message:
         return
 
-    label_map = {
-        "user": "User ID",
-        "chat": "Chat ID",
-        "topic": "Topic ID",
-    }
-    label = label_map.get(id_type, "ID")
+    line = template.format(value=value)
+    key = (query.message.chat_id, query.message.message_thread_id)
 
-    text = f"{label}: <code>{value}</code>"
+    pending = _PENDING_COPIES.get(key)
+    if pending is not None:
+        # A flush is already scheduled for this chat/topic.
+        pending.append(line)
+        return
 
-    sent = await query.message.reply_text(
-        text,
-        parse_mode="HTML",
-        disable_web_page_preview=True,
+    _PENDING_COPIES[key] = [line]
+    bot = context.bot
+    asyncio.get_running_loop().call_later(
+        _COPY_FLUSH_DELAY,
+        lambda: _spawn(_flush_copies(bot, key)),
     )
 
-    if sent:
-        msgs = SENT_MESSAGES[sent.chat_id]
-        msgs.append(sent.message_id)
-        if len(msgs) > 50:
-            msgs.pop(0)
-
 
 # 🔁 Forward detection
 async def forward_info_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -447,55 +775,73 @@ async def forward_info_handler(update: Update, context: ContextTypes.DEFAULT_TYP
     - In groups: admin-only and respects silent mode.
     """
     msg = update.effective_message
-    if not msg or not msg.forward_date:
+    # Bot API 7.0 replaced the forward_from* fields with forward_origin;
+    # the legacy properties are never populated on the 20.8 pin.
+    origin = msg.forward_origin if msg else None
+    if origin is None:
         return
 
     chat = update.effective_chat
 
     # Admin check for groups
-    if chat and chat.type != "private":
+    if _needs_admin_check(chat):
         if not await is_user_admin(update, context):
             return
         if is_silent_chat(chat):
             return
 
-    f_user = msg.forward_from
-    f_chat = msg.forward_from_chat
-    f_msg_id = msg.forward_from_message_id
-
-    lines = []
-    lines.append("📨 <b>Forwarded Message Info</b>")
-    lines.append("")
+    # Assemble the optional sections as whole blocks and join once,
+    # instead of a dozen list appends per forward.
+    user_block = chat_block = msg_block = None
 
-    if f_user:
+    if isinstance(origin, MessageOriginUser):
+        f_user = origin.sender_user
         uname = f"@{f_user.username}" if f_user.username else "(no username)"
-        lines.append("👤 <b>Original User</b>")
-        lines.append(f"User: {uname}")
-        lines.append(f"User ID: <code>{f_user.id}</code>")
-        lines.append("")
-
-    if f_chat:
+        user_block = (
+            "👤 <b>Original User</b>\n"
+            f"User: {uname}\n"
+            f"User ID: <code>{f_user.id}</code>"
+        )
+    elif isinstance(origin, MessageOriginHiddenUser):
+        user_block = (
+            "👤 <b>Original User</b>\n"
+            f"User: {origin.sender_user_name}\n"
+            "User ID: <i>(hidden by privacy settings)</i>"
+        )
+    elif isinstance(origin, (MessageOriginChat, MessageOriginChannel)):
+        f_chat = (
+            origin.sender_chat
+            if isinstance(origin, MessageOriginChat)
+            else origin.chat
+        )
         title = f_chat.title or "(no title)"
-        lines.append("💬 <b>Original Chat</b>")
-        lines.append(f"Chat Title: {title}")
-        lines.append(f"Chat ID: <code>{f_chat.id}</code>")
-        lines.append(f"Chat Type: <code>{f_chat.type}</code>")
-        lines.append("")
-
-    if f_msg_id:
-        lines.append("🆔 <b>Original Message</b>")
-        lines.append(f"Message ID: <code>{f_msg_id}</code>")
-        lines.append("")
-
-    if not (f_user or f_chat or f_msg_id):
-        lines.append("ℹ️ No original ID information is available for this forward.")
-        lines.append("This can happen due to privacy settings or anonymized forwards.")
-        lines.append("")
+        chat_block = (
+            "💬 <b>Original Chat</b>\n"
+            f"Chat Title: {title}\n"
+            f"Chat ID: <code>{f_chat.id}</code>\n"
+            f"Chat Type: <code>{f_chat.type}</code>"
+        )
+        if isinstance(origin, MessageOriginChannel):
+            msg_block = (
+                "🆔 <b>Original Message</b>\n"
+                f"Message ID: <code>{origin.message_id}</code>"
+            )
 
-    lines.append(f"🔧 <i>{BRAND_TAGLINE}</i>")
-    lines.append(f"🌐 {MADLABZ_SITE_URL}")
+    body = "\n\n".join(b for b in (user_block, chat_block, msg_block) if b)
+    if not body:
+        body = (
+            "ℹ️ No original ID information is available for this forward.\n"
+            "This can happen due to privacy settings or anonymized forwards."
+        )
 
-    text = "\n".join(lines)
+    text = (
+        "📨 <b>Forwarded Message Info</b>\n"
+        "\n"
+        f"{body}\n"
+        "\n"
+        f"🔧 <i>{BRAND_TAGLINE}</i>\n"
+        f"🌐 {MADLABZ_SITE_URL}"
+    )
 
     await _reply_in_same_place(update, context, text)
 
@@ -507,21 +853,15 @@ async def mode_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     - Group chats only
     - Admin-only
     """
+    global SILENT_CHATS
+
     chat = update.effective_chat
     if not chat or chat.type == "private":
-        await _reply_in_same_place(
-            update,
-            context,
-            "ℹ️ /mode is only for group chats.",
-        )
+        await _reply_in_same_place(update, context, _MODE_PRIVATE_TEXT)
         return
 
     if not await is_user_admin(update, context):
-        await _reply_in_same_place(
-            update,
-            context,
-            "⛔ Only chat admins can change mode.",
-        )
+        await _reply_in_same_place(update, context, _DENIED_MODE_TEXT)
         return
 
     chat_id = chat.id
@@ -529,39 +869,21 @@ async def mode_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not context.args:
         current = "silent" if chat_id in SILENT_CHATS else "group"
         await _reply_in_same_place(
-            update,
-            context,
-            f"⚙️ Current mode: <b>{current}</b>\n\n"
-            "Use:\n"
-            "• <code>/mode silent</code> – Bot stays quiet for ID commands in this chat\n"
-            "• <code>/mode group</code> – Bot replies normally again",
+            update, context, _MODE_USAGE_TEMPLATE.format(current=current)
         )
         return
 
     arg = context.args[0].lower()
     if arg == "silent":
-        SILENT_CHATS.add(chat_id)
-        await _reply_in_same_place(
-            update,
-            context,
-            "🤫 Silent mode <b>enabled</b> for this chat.\n"
-            "ID commands and forwarded messages will no longer get replies here.\n"
-            "Users can still DM the bot directly.",
-        )
+        SILENT_CHATS = SILENT_CHATS | {chat_id}
+        _invalidate_admin_cache(chat_id)
+        await _reply_in_same_place(update, context, _MODE_SILENT_TEXT)
     elif arg == "group":
-        SILENT_CHATS.discard(chat_id)
-        await _reply_in_same_place(
-            update,
-            context,
-            "💬 Group mode <b>enabled</b> for this chat.\n"
-            "ID commands and forwards will reply here again.",
-        )
+        SILENT_CHATS = SILENT_CHATS - {chat_id}
+        _invalidate_admin_cache(chat_id)
+        await _reply_in_same_place(update, context, _MODE_GROUP_TEXT)
     else:
-        await _reply_in_same_place(
-            update,
-            context,
-            "❓ Unknown mode.\nUse <code>/mode silent</code> or <code>/mode group</code>.",
-        )
+        await _reply_in_same_place(update, context, _MODE_UNKNOWN_TEXT)
 
 
 async def clean_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -570,35 +892,48 @@ async def clean_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     - Admin-only
     - Requires delete permissions
     """
-    if not await is_user_admin(update, context):
-        await _reply_in_same_place(
-            update,
-            context,
-            "⛔ Only chat admins can use /clean.",
-        )
-        return
-
     chat = update.effective_chat
     if not chat:
         return
 
+    if _needs_admin_check(chat) and not await is_user_admin(update, context):
+        await _reply_in_same_place(update, context, _DENIED_CLEAN_TEXT)
+        return
+
     chat_id = chat.id
     message_ids = SENT_MESSAGES.get(chat_id, [])
     if not message_ids:
-        await _reply_in_same_place(
-            update,
-            context,
-            "ℹ️ No recent bot messages to clean in this chat.",
-        )
+        await _reply_in_same_place(update, context, _CLEAN_EMPTY_TEXT)
         return
 
+    ids = list(message_ids)
     deleted = 0
-    for mid in list(message_ids):
-        try:
-            await context.bot.delete_message(chat_id=chat_id, message_id=mid)
-            deleted += 1
-        except (BadRequest, Forbidden) as e:
-            logger.warning("Failed to delete message %s: %s", mid, e)
+    try:
+        # deleteMessages takes up to 100 ids per call — one round trip
+        # instead of one per message.
+        for start in range(0, len(ids), 100):
+            chunk = ids[start : start + 100]
+            if await context.bot.delete_messages(chat_id=chat_id, message_ids=chunk):
+                deleted += len(chunk)
+    except (BadRequest, Forbidden) as e:
+        logger.warning("Batch delete failed (%s); falling back to per-message", e)
+        # Fan the per-message deletes out concurrently so their RTTs
+        # overlap, bounded to 8 in flight to respect the per-chat rate.
+        sem = asyncio.Semaphore(8)
+
+        async def _delete_one(mid: int):
+            async with sem:
+                await context.bot.delete_message(chat_id=chat_id, message_id=mid)
+
+        results = await asyncio.gather(
+            *(_delete_one(mid) for mid in ids), return_exceptions=True
+        )
+        deleted = 0
+        for mid, result in zip(ids, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to delete message %s: %s", mid, result)
+            else:
+                deleted += 1
 
     SENT_MESSAGES[chat_id].clear()
 
@@ -636,13 +971,75 @@ async def debug_all(update: Update, context: ContextTypes.DEFAULT_TYPE):
 # Main
 # -------------------------------------------------
 def main() -> None:
+    # uvloop roughly halves asyncio task-switch/socket overhead. Install
+    # it before the Application resolves an event loop; silently fall
+    # back on Windows or when it isn't installed (uvloop is POSIX-only).
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     bot_token = os.getenv("BOT_TOKEN")
     if not bot_token:
         raise RuntimeError("BOT_TOKEN missing in environment")
 
-    application = Application.builder().token(bot_token).build()
+    # The default httpx pool serializes outbound requests, which would
+    # cancel out concurrent_updates — size it so parallel handlers can
+    # have RPCs in flight at once, with a separate pool for polling.
+    # _REQUEST_CLASS additionally decodes responses with orjson when
+    # available. (Pool settings move onto the request objects because
+    # the builder forbids mixing .request() with its pool shortcuts.)
+    # Every outgoing message is HTML without link previews, and every
+    # handler is non-blocking — set all three once as Defaults instead
+    # of repeating (and re-validating) them per call / per handler.
+    defaults = Defaults(
+        parse_mode="HTML",
+        link_preview_options=LinkPreviewOptions(is_disabled=True),
+        block=False,
+    )
+
+    builder = (
+        Application.builder()
+        .token(bot_token)
+        .defaults(defaults)
+        .concurrent_updates(256)
+        .request(
+            _REQUEST_CLASS(
+                connection_pool_size=64,
+                pool_timeout=5,
+                connect_timeout=5,
+                read_timeout=10,
+                write_timeout=10,
+            )
+        )
+        .get_updates_request(
+            _REQUEST_CLASS(
+                connection_pool_size=16,
+                pool_timeout=5,
+                connect_timeout=5,
+                # Long polling holds the connection open for up to the
+                # getUpdates timeout, so give reads generous headroom.
+                read_timeout=65,
+                write_timeout=10,
+            )
+        )
+    )
 
-    # Commands
+    # Optional self-hosted Bot API server (tdlib/telegram-bot-api), e.g.
+    # BOT_API_URL=http://localhost:8081. Colocating it with the bot removes
+    # the RTT to api.telegram.org on every API call. When migrating an
+    # existing bot off the cloud API, call Bot.log_out() there once first.
+    bot_api_url = os.getenv("BOT_API_URL")
+    if bot_api_url:
+        builder = builder.base_url(f"{bot_api_url}/bot").base_file_url(
+            f"{bot_api_url}/file/bot"
+        )
+
+    application = builder.build()
+
+    # Commands (Defaults(block=False) keeps them non-blocking)
     application.add_handler(CommandHandler("start", start_or_help))
     application.add_handler(CommandHandler("help", start_or_help))
     application.add_handler(CommandHandler("about", about_command))
@@ -654,16 +1051,37 @@ def main() -> None:
     application.add_handler(CommandHandler("clean", clean_command))
 
     # Copy ID buttons
-    application.add_handler(CallbackQueryHandler(copy_id_callback, pattern=r"^copy:"))
+    application.add_handler(
+        CallbackQueryHandler(copy_id_callback, pattern=_is_copy_callback)
+    )
 
-    # Forward detection
-    application.add_handler(MessageHandler(filters.FORWARDED, forward_info_handler))
+    # Forward detection (silenced chats are filtered out at routing time)
+    application.add_handler(
+        MessageHandler(
+            filters.FORWARDED & NotSilentFilter(), forward_info_handler
+        )
+    )
 
     # Optional: uncomment for full debug mode
     # application.add_handler(MessageHandler(filters.ALL, debug_all))
 
-    logger.info("Starting IDBlasterBot...")
-    application.run_polling()
+    # Webhook mode avoids the getUpdates round-trip per update batch.
+    # WEBHOOK_URL is the public base URL of a TLS-terminating reverse
+    # proxy (or host) that forwards to this process; leave it unset for
+    # local development to fall back to polling.
+    webhook_url = os.getenv("WEBHOOK_URL")
+    if webhook_url:
+        logger.info("Starting IDBlasterBot (webhook mode)...")
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=int(os.getenv("PORT", "8443")),
+            url_path=bot_token,
+            webhook_url=f"{webhook_url}/{bot_token}",
+            secret_token=os.getenv("WEBHOOK_SECRET"),
+        )
+    else:
+        logger.info("Starting IDBlasterBot (polling mode)...")
+        application.run_polling()
 
 
 if __name__ == "__main__":